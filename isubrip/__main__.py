@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import datetime as dt
 import logging
 from pathlib import Path
 import shutil
@@ -9,19 +10,16 @@ from typing import List, Union
 
 import httpx
 
+from isubrip import constants
 from isubrip.config import Config, ConfigError, ConfigSetting, SpecialConfigType
 from isubrip.constants import (
     ARCHIVE_FORMAT,
-    DATA_FOLDER_PATH,
     DEFAULT_CONFIG_PATH,
-    EVENT_LOOP,
     LOG_FILE_NAME,
-    LOG_FILES_PATH,
+    LOG_FILE_TIMESTAMP_FORMAT,
     PACKAGE_NAME,
     PACKAGE_VERSION,
     PREORDER_MESSAGE,
-    TEMP_FOLDER_PATH,
-    USER_CONFIG_FILE,
 )
 from isubrip.data_structures import (
     Episode,
@@ -49,7 +47,7 @@ from isubrip.utils import (
 
 LOG_ROTATION_SIZE: int | None = None
 
-BASE_CONFIG_SETTINGS = [
+BASE_CONFIG_SETTINGS: tuple[ConfigSetting, ...] = (
     ConfigSetting(
         key="check-for-updates",
         value_type=bool,
@@ -147,18 +145,22 @@ BASE_CONFIG_SETTINGS = [
         category="scrapers",
         required=False,
     ),
-]
+)
 
 
 def main() -> None:
+    # Shared between download and cleanup, as async HTTP clients are bound to the loop they were first used on.
+    event_loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(event_loop)
+
     try:
         # Assure at least one argument was passed
         if len(sys.argv) < 2:
             print_usage()
             exit(0)
 
-        if not DATA_FOLDER_PATH.is_dir():
-            DATA_FOLDER_PATH.mkdir(parents=True)
+        if not constants.DATA_FOLDER_PATH.is_dir():
+            constants.DATA_FOLDER_PATH.mkdir(parents=True)
 
         setup_loggers(stdout_loglevel=logging.INFO,
                       file_loglevel=logging.DEBUG)
@@ -176,7 +178,7 @@ def main() -> None:
             check_for_updates(current_package_version=PACKAGE_VERSION)
 
         urls = single_to_list(sys.argv[1:])
-        EVENT_LOOP.run_until_complete(download(urls=urls, config=config))
+        event_loop.run_until_complete(download(urls=urls, config=config))
 
     except Exception as ex:
         logger.error(f"Error: {ex}")
@@ -195,7 +197,8 @@ def main() -> None:
             scraper.close()
             async_cleanup_coroutines.append(scraper.async_close())
 
-        EVENT_LOOP.run_until_complete(asyncio.gather(*async_cleanup_coroutines))
+        event_loop.run_until_complete(asyncio.gather(*async_cleanup_coroutines))
+        event_loop.close()
         TempDirGenerator.cleanup()
 
 
@@ -381,7 +384,7 @@ async def download_subtitles(scraper: Scraper, media_data: Movie | Episode, down
     if not media_data.playlist:
         raise PlaylistLoadError("No playlist was found for provided media data.")
 
-    main_playlist = scraper.load_playlist(url=media_data.playlist)
+    main_playlist = await scraper.async_load_playlist(url=media_data.playlist)
     matching_subtitles = scraper.find_matching_subtitles(main_playlist=main_playlist,  # type: ignore[var-annotated]
                                                          language_filter=language_filter)
 
@@ -468,7 +471,8 @@ def handle_log_rotation(log_rotation_size: int) -> None:
     Args:
         log_rotation_size (int): Maximum amount of log files to keep.
     """
-    sorted_log_files = sorted(LOG_FILES_PATH.glob("*.log"), key=lambda file: file.stat().st_mtime, reverse=True)
+    sorted_log_files = sorted(constants.LOG_FILES_PATH.glob("*.log"),
+                              key=lambda file: file.stat().st_mtime, reverse=True)
 
     if len(sorted_log_files) > log_rotation_size:
         for log_file in sorted_log_files[log_rotation_size:]:
@@ -500,21 +504,21 @@ def generate_config() -> Config:
     logger.debug("Default config data loaded and validated successfully.")
 
     # If logs folder doesn't exist, create it (also handles data folder)
-    if not DATA_FOLDER_PATH.is_dir():
-        logger.debug(f"'{DATA_FOLDER_PATH}' directory could not be found and will be created.")
-        DATA_FOLDER_PATH.mkdir(parents=True, exist_ok=True)
-        LOG_FILES_PATH.mkdir()
+    if not constants.DATA_FOLDER_PATH.is_dir():
+        logger.debug(f"'{constants.DATA_FOLDER_PATH}' directory could not be found and will be created.")
+        constants.DATA_FOLDER_PATH.mkdir(parents=True, exist_ok=True)
+        constants.LOG_FILES_PATH.mkdir()
 
     else:
-        if not LOG_FILES_PATH.is_dir():
-            logger.debug(f"'{LOG_FILES_PATH}' directory could not be found and will be created.")
-            LOG_FILES_PATH.mkdir()
+        if not constants.LOG_FILES_PATH.is_dir():
+            logger.debug(f"'{constants.LOG_FILES_PATH}' directory could not be found and will be created.")
+            constants.LOG_FILES_PATH.mkdir()
 
         # If a user config file exists, add it to config_files
-        if USER_CONFIG_FILE.is_file():
-            logger.info(f"User config file detected at '{USER_CONFIG_FILE}' and will be used.")
+        if constants.USER_CONFIG_FILE.is_file():
+            logger.info(f"User config file detected at '{constants.USER_CONFIG_FILE}' and will be used.")
 
-            with USER_CONFIG_FILE.open('r') as data:
+            with constants.USER_CONFIG_FILE.open('r') as data:
                 config.loads(config_data=data.read(), check_config=True)
 
             logger.debug("User config file loaded and validated successfully.")
@@ -560,7 +564,7 @@ def generate_temp_media_path(media_data: Movie | Episode, source: str | None = N
         Path: A path to the temporary folder.
     """
     temp_folder_name = generate_media_folder_name(media_data=media_data, source=source)
-    path = generate_non_conflicting_path(file_path=TEMP_FOLDER_PATH / temp_folder_name, has_extension=False)
+    path = generate_non_conflicting_path(file_path=constants.TEMP_FOLDER_PATH / temp_folder_name, has_extension=False)
 
     return TempDirGenerator.generate(directory_name=path.name)
 
@@ -605,7 +609,8 @@ def setup_loggers(stdout_loglevel: int, file_loglevel: int) -> None:
         stdout_loglevel (int): Log level for STDOUT logger.
         file_loglevel (int): Log level for logfile logger.
     """
-    logger.setLevel(logging.DEBUG)
+    # Records below both handlers' levels are dropped by the logger itself, before a LogRecord is created.
+    logger.setLevel(min(stdout_loglevel, file_loglevel))
 
     # Setup STDOUT logger
     stdout_handler = logging.StreamHandler(sys.stdout)
@@ -614,11 +619,12 @@ def setup_loggers(stdout_loglevel: int, file_loglevel: int) -> None:
     logger.addHandler(stdout_handler)
 
     # Setup logfile logger
-    if not LOG_FILES_PATH.is_dir():
+    if not constants.LOG_FILES_PATH.is_dir():
         logger.debug("Logs directory could not be found and will be created.")
-        LOG_FILES_PATH.mkdir()
+        constants.LOG_FILES_PATH.mkdir()
 
-    logfile_path = generate_non_conflicting_path(file_path=LOG_FILES_PATH / LOG_FILE_NAME)
+    log_file_name = LOG_FILE_NAME.format(timestamp=dt.datetime.now().strftime(LOG_FILE_TIMESTAMP_FORMAT))
+    logfile_path = generate_non_conflicting_path(file_path=constants.LOG_FILES_PATH / log_file_name)
     logfile_handler = logging.FileHandler(filename=logfile_path, encoding="utf-8")
     logfile_handler.setLevel(file_loglevel)
     logfile_handler.setFormatter(CustomLogFileFormatter())
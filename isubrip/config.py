@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 import typing
-from typing import Any, NamedTuple, Type
+from typing import Any, Type
 
 from mergedeep import merge
 import tomli
@@ -38,20 +39,26 @@ class SpecialConfigType(Enum):
     EXISTING_FOLDER_PATH = 2
 
 
-class ConfigSetting(NamedTuple):
+# TODO: Use `slots=True` once minimum Python version >= 3.10.
+@dataclass(frozen=True, eq=False)
+class ConfigSetting:
     """
-    A NamedTuple representing a config setting.
+    A frozen dataclass representing a config setting.
 
     Attributes:
         key (str): Dictionary key used to access the setting.
         value_type (type): Variable type of the value of the setting. Used for validation.
         category (str | tuple[str, ...], optional): A category that the setting is under.
             Categories are used to group related settings' keys together in a sub-dictionary.
-            A tuple can be used to nest categories (first item is the top-level category). Defaults to None.
+            A tuple can be used to nest categories (first item is the top-level category).
+            Normalized to a tuple on creation (empty if no category is set). Defaults to None.
         required (bool, optional): Whether the setting is required. Defaults to False.
         enum_type (type[Enum], optional): An Enum that the settings values will be converted to. Defaults to None.
         special_type (SpecialConfigType | list[SpecialConfigType], optional): A special property of the setting's value
             to validate, represented by a SpecialConfigType value. Defaults to None.
+        path (str): Full dotted path of the setting (categories followed by the key). Generated on creation.
+        is_file_path (bool): Whether the value must be a path to an existing file. Generated on creation.
+        is_folder_path (bool): Whether the value must be a path to an existing folder. Generated on creation.
     """
     key: str
     # TODO: Use `types.UnionType` instead of `typing._UnionGenericAlias`, once minimum Python version >= 3.10.
@@ -61,26 +68,51 @@ class ConfigSetting(NamedTuple):
     required: bool = False
     enum_type: Type[Enum] | None = None
     special_type: SpecialConfigType | list[SpecialConfigType] | None = None
+    path: str = field(init=False, repr=False)
+    is_file_path: bool = field(init=False, repr=False)
+    is_folder_path: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.category is None:
+            category: tuple[str, ...] = ()
+
+        elif isinstance(self.category, str):
+            category = (self.category,)
+
+        else:
+            category = tuple(self.category)
+
+        object.__setattr__(self, "category", category)
+        object.__setattr__(self, "path", '.'.join((*category, self.key)))
+
+        special_types = single_to_list(self.special_type)
+        object.__setattr__(self, "is_file_path", SpecialConfigType.EXISTING_FILE_PATH in special_types)
+        object.__setattr__(self, "is_folder_path", SpecialConfigType.EXISTING_FOLDER_PATH in special_types)
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, ConfigSetting):
             return self.key == other.key and self.category == other.category
         return False
 
+    def __hash__(self) -> int:
+        return hash((self.key, self.category))
+
 
 class Config:
     """A class for managing iSubRip config files."""
-    def __init__(self, config_settings: list[ConfigSetting] | None = None, config_data: dict | None = None):
+    def __init__(self, config_settings: list[ConfigSetting] | tuple[ConfigSetting, ...] | None = None,
+                 config_data: dict | None = None):
         """
         Create a new Config instance.
 
         Args:
-            config_settings (list[ConfigSetting], optional): A list of ConfigSettings objects
+            config_settings (list[ConfigSetting] | tuple[ConfigSetting, ...], optional): ConfigSettings objects
                 that will be used for validations. Defaults to None.
             config_data (dict, optional): A dict of config data to add to the config. Defaults to None.
         """
         self._config_settings: list = []
         self._config_data: dict = {}
+        self._dirty = True  # Whether settings or data have changed since the last successful check
 
         if config_settings:
             self.add_settings(config_settings, check_config=False)
@@ -144,15 +176,15 @@ class Config:
     def data(self) -> dict:
         return self._config_data
 
-    def add_settings(self, config_settings: ConfigSetting | list[ConfigSetting],
+    def add_settings(self, config_settings: ConfigSetting | list[ConfigSetting] | tuple[ConfigSetting, ...],
                      duplicate_behavior: DuplicateBehavior = DuplicateBehavior.OVERWRITE,
                      check_config: bool = True) -> None:
         """
         Add new config settings to the config.
 
         Args:
-            config_settings (ConfigSetting | list[ConfigSetting]): A ConfigSetting object or a list of ConfigSetting
-                objects to add to the config.
+            config_settings (ConfigSetting | list[ConfigSetting] | tuple[ConfigSetting, ...]):
+                A ConfigSetting object, or a list / tuple of ConfigSetting objects to add to the config.
             duplicate_behavior (DuplicateBehavior, optional): Behaviour to apply if a duplicate is found.
                 Defaults to DuplicateBehavior.OVERWRITE.
             check_config (bool, optional): Whether to check the config after loading it. Defaults to True.
@@ -164,14 +196,16 @@ class Config:
                 if duplicate_behavior == DuplicateBehavior.OVERWRITE:
                     self._config_settings.remove(config_setting)
                     self._config_settings.append(config_setting)
+                    self._dirty = True
 
                 elif duplicate_behavior == DuplicateBehavior.RAISE_ERROR:
                     raise ValueError(f"Duplicate config setting: {config_setting}")
 
             else:
                 self._config_settings.append(config_setting)
+                self._dirty = True
 
-        if check_config:
+        if check_config and self._dirty:
             self.check()
 
     def loads(self, config_data: str, check_config: bool = True) -> None:
@@ -199,7 +233,10 @@ class Config:
 
         self._config_data = temp_config
 
-        if check_config and self._config_settings:
+        if loaded_data:
+            self._dirty = True
+
+        if check_config and self._config_settings and self._dirty:
             self.check()
 
     def _map_config_settings(self, settings: list[ConfigSetting], data: dict) -> dict[ConfigSetting, Any]:
@@ -218,10 +255,9 @@ class Config:
 
         for setting in settings:
             if setting.category:
-                setting_categories = single_to_list(setting.category)
                 config_dict_iter: dict = data
 
-                for setting_category in setting_categories:
+                for setting_category in setting.category:
                     if setting_category not in config_dict_iter:
                         mapped_settings[setting] = None
                         break
@@ -243,16 +279,13 @@ class Config:
                         value = enum_type(value)
 
                     except ValueError as e:
-                        setting_path = '.'.join(single_to_list(setting.category))
-                        raise InvalidEnumConfigValueError(setting_path=setting_path,
+                        raise InvalidEnumConfigValueError(setting_path=setting.path,
                                                           value=value, enum_type=enum_type) from e
 
                 if type(value) in (list, tuple) and len(value) == 0:
                     value = None
 
-                special_types = single_to_list(setting.special_type)
-
-                if SpecialConfigType.EXISTING_FILE_PATH in special_types:
+                if setting.is_file_path:
                     value = value.rstrip(r"\/")
 
                 mapped_settings[setting] = value
@@ -274,14 +307,7 @@ class Config:
         mapped_config = self._map_config_settings(self._config_settings, self._config_data)
 
         for setting, value in mapped_config.items():
-            if isinstance(setting.category, (list, tuple)):
-                setting_path = '.'.join(setting.category) + f".{setting.key}"
-
-            elif isinstance(setting.category, str):
-                setting_path = setting.category + f".{setting.key}"
-
-            else:
-                setting_path = setting.key
+            setting_path = setting.path
 
             if value is None:
                 if setting.required:
@@ -292,14 +318,14 @@ class Config:
             if setting.enum_type is None and not check_type(value, setting.value_type):
                 raise InvalidConfigTypeError(setting_path=setting_path, value=value, expected_type=setting.value_type)
 
-            special_types = single_to_list(setting.special_type)
-
-            if SpecialConfigType.EXISTING_FILE_PATH in special_types and not Path(value).is_file():
+            if setting.is_file_path and not Path(value).is_file():
                 raise InvalidConfigFilePathError(setting_path=setting_path, value=value)
 
-            if SpecialConfigType.EXISTING_FOLDER_PATH in special_types and not Path(value).is_dir():
+            if setting.is_folder_path and not Path(value).is_dir():
                 raise InvalidConfigFolderPathError(setting_path=setting_path, value=value)
 
+        self._dirty = False
+
 
 class ConfigError(Exception):
     pass
@@ -308,30 +334,47 @@ class ConfigError(Exception):
 class MissingRequiredConfigSettingError(ConfigError):
     """A required config value is missing."""
     def __init__(self, setting_path: str):
-        super().__init__(f"Missing required config value: '{setting_path}'.")
+        super().__init__(setting_path)
+        self.setting_path = setting_path
+
+    def __str__(self) -> str:
+        return f"Missing required config value: '{self.setting_path}'."
 
 
 class InvalidConfigValueError(ConfigError):
-    """An invalid config setting has been set."""
+    """
+    An invalid config setting has been set.
+    The error message is only generated when the exception is rendered.
+    """
     def __init__(self, setting_path: str, value: Any, additional_note: str | None = None):
-        message = f"Invalid config value for '{setting_path}': '{value}'."
+        super().__init__(setting_path, value)
+        self.setting_path = setting_path
+        self.value = value
+        self._additional_note = additional_note
+
+    @property
+    def additional_note(self) -> str | None:
+        return self._additional_note
 
-        if additional_note:
+    def __str__(self) -> str:
+        message = f"Invalid config value for '{self.setting_path}': '{self.value}'."
+
+        if additional_note := self.additional_note:
             message += f"\n{additional_note}"
 
-        super().__init__(message)
+        return message
 
 
 class InvalidEnumConfigValueError(InvalidConfigValueError):
     """An invalid config value of an enum type setting has been set."""
     def __init__(self, setting_path: str, value: Any, enum_type: type[Enum]):
-        enum_options = ', '.join([f"'{option.name}'" for option in enum_type])
+        super().__init__(setting_path=setting_path, value=value)
+        self.enum_type = enum_type
 
-        super().__init__(
-            setting_path=setting_path,
-            value=value,
-            additional_note=f"Value can only be one of: {enum_options}.",
-        )
+    @property
+    def additional_note(self) -> str:
+        enum_options = ', '.join([f"'{option.name}'" for option in self.enum_type])
+        return f"Value can only be one of: {enum_options}."
 
 
 class InvalidConfigTypeError(InvalidConfigValueError):
@@ -339,31 +382,27 @@ class InvalidConfigTypeError(InvalidConfigValueError):
     def __init__(self, setting_path: str,
                  expected_type: type | typing._UnionGenericAlias,  # type: ignore[name-defined]
                  value: Any):
+        super().__init__(setting_path=setting_path, value=value)
+        self.expected_type = expected_type
+
+    @property
+    def additional_note(self) -> str:
+        expected_type = self.expected_type
         expected_type_str = expected_type.__name__ if hasattr(expected_type, '__name__') else str(expected_type)
-        value_type_str = type(value).__name__ if hasattr(type(value), '__name__') else str(type(value))
+        value_type_str = type(self.value).__name__ if hasattr(type(self.value), '__name__') else str(type(self.value))
 
-        super().__init__(
-            setting_path=setting_path,
-            value=value,
-            additional_note=f"Expected type: '{expected_type_str}'. Received: '{value_type_str}'.",
-        )
+        return f"Expected type: '{expected_type_str}'. Received: '{value_type_str}'."
 
 
 class InvalidConfigFilePathError(InvalidConfigValueError):
     """An invalid config value of a file path has been set."""
-    def __init__(self, setting_path: str, value: str):
-        super().__init__(
-            setting_path=setting_path,
-            value=value,
-            additional_note=f"File '{value}' not found.",
-        )
+    @property
+    def additional_note(self) -> str:
+        return f"File '{self.value}' not found."
 
 
 class InvalidConfigFolderPathError(InvalidConfigValueError):
     """An invalid config value of a folder path has been set."""
-    def __init__(self, setting_path: str, value: str):
-        super().__init__(
-            setting_path=setting_path,
-            value=value,
-            additional_note=f"Folder '{value}' not found.",
-        )
+    @property
+    def additional_note(self) -> str:
+        return f"Folder '{self.value}' not found."
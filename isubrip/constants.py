@@ -1,18 +1,14 @@
 from __future__ import annotations
 
-import asyncio
-import datetime as dt
 import logging
 from pathlib import Path
+import re
 from tempfile import gettempdir
 
 # General
 PACKAGE_NAME = "isubrip"
 PACKAGE_VERSION = "2.5.6"
 
-# Async
-EVENT_LOOP = asyncio.get_event_loop()
-
 # Logging
 PREORDER_MESSAGE = ("'{movie_name}' is currently unavailable on {scraper_name}, "
                     "and will be available on {preorder_date}.")
@@ -33,23 +29,63 @@ LOGGING_FILE_METADATA = "[%(asctime)s | %(levelname)s | %(threadName)s | %(filen
 ARCHIVE_FORMAT = "zip"
 
 # Paths
+# NOTE: Paths that require environment / filesystem lookups ('DATA_FOLDER_PATH', 'TEMP_FOLDER_PATH',
+# and paths derived from them) are only declared here, and are resolved on first access by '__getattr__' below.
+# To keep them lazy, access them as 'constants.<NAME>' at the point of use, rather than importing them by name.
 DEFAULT_CONFIG_PATH = Path(__file__).parent / "resources" / "default_config.toml"
-DATA_FOLDER_PATH = Path.home() / f".{PACKAGE_NAME}"
+DATA_FOLDER_PATH: Path
 SCRAPER_MODULES_SUFFIX = "_scraper"
-TEMP_FOLDER_PATH = Path(gettempdir()) / PACKAGE_NAME
+TEMP_FOLDER_PATH: Path
 
 # Config Paths
 USER_CONFIG_FILE_NAME = "config.toml"
-USER_CONFIG_FILE = DATA_FOLDER_PATH / USER_CONFIG_FILE_NAME
+USER_CONFIG_FILE: Path
 
 # Logging Paths
-LOG_FILES_PATH = DATA_FOLDER_PATH / "logs"
-LOG_FILE_NAME = f"{PACKAGE_NAME}_{dt.datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.log"
+LOG_FILES_PATH: Path
+LOG_FILE_NAME = PACKAGE_NAME + "_{timestamp}.log"  # Timestamp is set when the log file is created
+LOG_FILE_TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S"
 
 # Other
+MULTIPLE_DOTS_REGEX = re.compile(r"\.+")
 TITLE_REPLACEMENT_STRINGS = {  # Replacements will be done by the order of the keys.
     ": ": ".", ":": ".", " - ": "-", ", ": ".", ". ": ".", " ": ".", "|": ".", "/": ".", "…": ".",
     "<": "", ">": "", "(": "", ")": "", '"': "", "?": "", "*": "",
 }
-WINDOWS_RESERVED_FILE_NAMES = ("CON", "PRN", "AUX", "NUL", "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7",
-                               "COM8", "COM9", "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9")
+# Single characters that are removed (which are the last keys) are handled at once by a translation table,
+# after the rest of the replacements. Removing characters can't create a match for any other key.
+TITLE_REPLACEMENTS = tuple(
+    (key, value) for key, value in TITLE_REPLACEMENT_STRINGS.items() if len(key) > 1 or value
+)
+TITLE_REMOVAL_TABLE = str.maketrans("", "", "".join(
+    key for key, value in TITLE_REPLACEMENT_STRINGS.items() if len(key) == 1 and not value
+))
+WINDOWS_RESERVED_FILE_NAMES = frozenset((
+    "CON", "PRN", "AUX", "NUL", "COM1", "COM2", "COM3", "COM4", "COM5", "COM6", "COM7",
+    "COM8", "COM9", "LPT1", "LPT2", "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9",
+))
+
+
+def __getattr__(name: str) -> Path:
+    """Resolve lazily-evaluated path constants on first access, and cache them as module attributes."""
+    # Also called directly to resolve paths that others are derived from, which might already be cached
+    if name in globals():
+        return globals()[name]  # type: ignore[no-any-return]
+
+    if name == "DATA_FOLDER_PATH":
+        value = Path.home() / f".{PACKAGE_NAME}"
+
+    elif name == "TEMP_FOLDER_PATH":
+        value = Path(gettempdir()) / PACKAGE_NAME
+
+    elif name == "USER_CONFIG_FILE":
+        value = __getattr__("DATA_FOLDER_PATH") / USER_CONFIG_FILE_NAME
+
+    elif name == "LOG_FILES_PATH":
+        value = __getattr__("DATA_FOLDER_PATH") / "logs"
+
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+    globals()[name] = value
+    return value
@@ -1,18 +1,17 @@
 from __future__ import annotations
 
-from abc import ABC
+from dataclasses import dataclass, field
 import datetime as dt  # noqa: TCH003
 from enum import Enum
-from typing import TYPE_CHECKING, Generic, List, Literal, NamedTuple, Optional, TypeVar, Union
-
-import m3u8
-from pydantic import BaseModel
+from typing import TYPE_CHECKING, ClassVar, Generic, List, Literal, NamedTuple, Optional, TypeVar, Union
 
 if TYPE_CHECKING:
+    import m3u8
+
     from isubrip.scrapers.scraper import SubtitlesDownloadError
 
-MainPlaylist = TypeVar("MainPlaylist", bound=m3u8.M3U8)
-PlaylistMediaItem = TypeVar("PlaylistMediaItem", bound=m3u8.Media)
+MainPlaylist = TypeVar("MainPlaylist", bound="m3u8.M3U8")
+PlaylistMediaItem = TypeVar("PlaylistMediaItem", bound="m3u8.Media")
 
 MediaData = TypeVar("MediaData", bound="MediaBase")
 
@@ -33,9 +32,9 @@ class SubtitlesDownloadResults(NamedTuple):
     is_zip: bool
 
 
-class SubtitlesFormat(BaseModel):
+class SubtitlesFormat(NamedTuple):
     """
-    An object containing subtitles format data.
+    A named tuple containing subtitles format data.
 
     Attributes:
         name (str): Name of the format.
@@ -69,9 +68,11 @@ class SubtitlesType(Enum):
     FORCED = "Forced"
 
 
-# TODO: Use `kw_only` on dataclasses, and set default values of None for optional arguments once min version => 3.10
+# TODO: Use `kw_only` and `slots` on dataclasses, and set default values of None for optional arguments
+#  once min version => 3.10
 
-class SubtitlesData(BaseModel):
+@dataclass
+class SubtitlesData:
     """
     An object containing subtitles data and metadata.
 
@@ -90,14 +91,19 @@ class SubtitlesData(BaseModel):
     language_name: Optional[str] = None
     special_type: Union[SubtitlesType, None] = None
 
-    class ConfigDict:
-        str_strip_whitespace = True
 
+@dataclass
+class MediaBase:
+    """
+    A base class for media objects.
 
-class MediaBase(BaseModel, ABC):
-    """A base class for media objects."""
+    Attributes:
+        media_type (str): [Class Attribute] Type of the media.
+    """
+    media_type: ClassVar[str]
 
 
+@dataclass
 class Movie(MediaBase):
     """
     An object containing movie metadata.
@@ -114,7 +120,7 @@ class Movie(MediaBase):
             None if not a pre-order. Defaults to None.
         playlist (str | None, optional): Main playlist URL(s).
     """
-    media_type: Literal["movie"] = "movie"
+    media_type: ClassVar[Literal["movie"]] = "movie"
     name: str
     release_date: Union[dt.datetime, int]
     id: Optional[str] = None
@@ -124,6 +130,7 @@ class Movie(MediaBase):
     playlist: Union[str, List[str], None] = None
 
 
+@dataclass
 class Episode(MediaBase):
     """
     An object containing episode metadata.
@@ -142,7 +149,7 @@ class Episode(MediaBase):
         episode_duration (timedelta | None, optional): Duration of the episode. Defaults to None.
         playlist (str | None, optional): Main playlist URL(s).
     """
-    media_type: Literal["episode"] = "episode"
+    media_type: ClassVar[Literal["episode"]] = "episode"
     series_name: str
     season_number: int
     episode_number: int
@@ -158,6 +165,7 @@ class Episode(MediaBase):
     playlist: Union[str, List[str], None] = None
 
 
+@dataclass
 class Season(MediaBase):
     """
     An object containing season metadata.
@@ -172,7 +180,7 @@ class Season(MediaBase):
         season_release_date (datetime | None, optional): Release date of the season, or release year. Defaults to None.
         episodes (list[Episode]): A list of episode objects containing metadata about episodes of the season.
     """
-    media_type: Literal["season"] = "season"
+    media_type: ClassVar[Literal["season"]] = "season"
     series_name: str
     season_number: int
     id: Optional[str] = None
@@ -180,9 +188,10 @@ class Season(MediaBase):
     series_release_date: Union[dt.datetime, int, None] = None
     season_name: Optional[str] = None
     season_release_date: Union[dt.datetime, int, None] = None
-    episodes: List[Episode] = []
+    episodes: List[Episode] = field(default_factory=list)
 
 
+@dataclass
 class Series(MediaBase):
     """
     An object containing series metadata.
@@ -195,15 +204,16 @@ class Series(MediaBase):
             Defaults to None.
         seasons (list[Season]): A list of season objects containing metadata about seasons of the series.
     """
-    media_type: Literal["series"] = "series"
+    media_type: ClassVar[Literal["series"]] = "series"
     series_name: str
-    seasons: List[Season] = []
+    seasons: List[Season] = field(default_factory=list)
     id: Optional[str] = None
     referer_id: Optional[str] = None
     series_release_date: Union[dt.datetime, int, None] = None
 
 
-class ScrapedMediaResponse(BaseModel, Generic[MediaData]):
+@dataclass
+class ScrapedMediaResponse(Generic[MediaData]):
     """
     An object containing scraped media data and metadata.
 
@@ -33,15 +33,14 @@ def get_formatter(fmt: str, datefmt: str = LOGGING_DATE_FORMAT) -> logging.Forma
 
 
 class CustomStdoutFormatter(logging.Formatter):
-    def format(self, record: logging.LogRecord) -> str:
-        if record.levelno in ANSI_COLORS:
-            log_format = ANSI_COLORS[record.levelno] + "%(message)s" + RESET_COLOR
-
-        else:
-            log_format = "%(message)s"
+    _formatters = {
+        level: get_formatter(fmt=color + "%(message)s" + RESET_COLOR, datefmt=LOGGING_DATE_FORMAT)
+        for level, color in ANSI_COLORS.items()
+    }
+    _default_formatter = get_formatter(fmt="%(message)s", datefmt=LOGGING_DATE_FORMAT)
 
-        formatter = get_formatter(fmt=log_format, datefmt=LOGGING_DATE_FORMAT)
-        return formatter.format(record)
+    def format(self, record: logging.LogRecord) -> str:
+        return self._formatters.get(record.levelno, self._default_formatter).format(record)
 
 
 class CustomLogFileFormatter(logging.Formatter):
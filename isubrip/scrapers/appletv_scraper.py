@@ -4,6 +4,7 @@ import datetime as dt
 from enum import Enum
 import fnmatch
 import re
+from types import MappingProxyType
 
 from httpx import HTTPError
 
@@ -56,12 +57,12 @@ class AppleTVScraper(HLSScraper):
     }
 
     _api_base_url = "https://tv.apple.com/api/uts/v3"
-    _api_base_params = {
+    _api_base_params = MappingProxyType({
         "utscf": "OjAAAAAAAAA~",
         "caller": "js",
         "v": "66",
         "pfm": "web",
-    }
+    })
 
     class Channel(Enum):
         """
@@ -181,7 +182,7 @@ class AppleTVScraper(HLSScraper):
         Returns:
             dict: The request params, generated from the given arguments.
         """
-        params = self._api_base_params.copy()
+        params = dict(self._api_base_params)
         params["sf"] = storefront_id
 
         if utsk:
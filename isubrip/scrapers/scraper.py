@@ -178,6 +178,7 @@ class Scraper(ABC, metaclass=SingletonMeta):
             "verify": self._verify_ssl,
             "proxy": self._proxy,
             "timeout": float(self._timeout),
+            "http2": True,
         }
         self._session = httpx.Client(
             **clients_params,
@@ -235,12 +236,12 @@ class Scraper(ABC, metaclass=SingletonMeta):
         Raises:
             ValueError: If the URL doesn't match the regex and raise_error is True.
         """
-        if isinstance(cls.url_regex, re.Pattern) and (match_result := re.fullmatch(pattern=cls.url_regex, string=url)):
+        if isinstance(cls.url_regex, re.Pattern) and (match_result := cls.url_regex.fullmatch(url)):
             return match_result
 
         if isinstance(cls.url_regex, list):
             for url_regex_item in cls.url_regex:
-                if result := re.fullmatch(pattern=url_regex_item, string=url):
+                if result := url_regex_item.fullmatch(url):
                     return result
 
         if raise_error:
@@ -317,7 +318,7 @@ class Scraper(ABC, metaclass=SingletonMeta):
         """
 
     @abstractmethod
-    def load_playlist(self, url: str | list[str], headers: dict | None = None) -> MainPlaylist | None:
+    def load_playlist(self, url: str | list[str], headers: dict | None = None) -> m3u8.M3U8 | None:
         """
         Load a playlist from a URL to a representing object.
         Multiple URLs can be given, in which case the first one that loads successfully will be returned.
@@ -328,7 +329,22 @@ class Scraper(ABC, metaclass=SingletonMeta):
                 Defaults to None (results in using session's configured headers).
 
         Returns:
-            MainPlaylist | None: A playlist object (matching the type), or None if the playlist couldn't be loaded.
+            m3u8.M3U8 | None: A playlist object, or None if the playlist couldn't be loaded.
+        """
+
+    @abstractmethod
+    async def async_load_playlist(self, url: str | list[str], headers: dict | None = None) -> m3u8.M3U8 | None:
+        """
+        Load a playlist from a URL to a representing object, without blocking the event loop.
+        Multiple URLs can be given, in which case the first one that loads successfully will be returned.
+
+        Args:
+            url (str | list[str]): URL of the M3U8 playlist to load. Can also be a list of URLs (for redundancy).
+            headers (dict | None, optional): A dictionary of headers to use when making the request.
+                Defaults to None (results in using session's configured headers).
+
+        Returns:
+            m3u8.M3U8 | None: A playlist object, or None if the playlist couldn't be loaded.
         """
 
 
@@ -384,25 +400,51 @@ class HLSScraper(Scraper, ABC):
         name: str | None = media_data.name
         return name
 
-    def load_playlist(self, url: str | list[str], headers: dict | None = None) -> m3u8.M3U8 | None:
-        _headers = headers or self._session.headers
-        result: m3u8.M3U8 | None = None
+    @staticmethod
+    def _parse_playlist_response(response: httpx.Response, url: str) -> m3u8.M3U8:
+        """
+        Parse a playlist response to an M3U8 object.
+
+        Args:
+            response (httpx.Response): Response of the playlist request.
+            url (str): URL the playlist was loaded from (used for resolving relative URIs).
+
+        Returns:
+            m3u8.M3U8: The parsed playlist.
+
+        Raises:
+            PlaylistLoadError: If the response is empty.
+        """
+        if not response.text:
+            raise PlaylistLoadError("Received empty response for playlist from server.")
+
+        return m3u8.loads(content=response.text, uri=url)
 
+    def load_playlist(self, url: str | list[str], headers: dict | None = None) -> m3u8.M3U8 | None:
         for url_item in single_to_list(url):
             try:
-                response = self._session.get(url=url_item, headers=_headers, timeout=5)
+                response = self._session.get(url=url_item, headers=headers, timeout=5)
 
             except Exception as e:
                 logger.debug(f"Failed to load M3U8 playlist '{url_item}': {e}")
                 continue
 
-            if not response.text:
-                raise PlaylistLoadError("Received empty response for playlist from server.")
+            return self._parse_playlist_response(response=response, url=url_item)
 
-            result = m3u8.loads(content=response.text, uri=url_item)
-            break
+        return None
 
-        return result
+    async def async_load_playlist(self, url: str | list[str], headers: dict | None = None) -> m3u8.M3U8 | None:
+        for url_item in single_to_list(url):
+            try:
+                response = await self._async_session.get(url=url_item, headers=headers, timeout=5)
+
+            except Exception as e:
+                logger.debug(f"Failed to load M3U8 playlist '{url_item}': {e}")
+                continue
+
+            return self._parse_playlist_response(response=response, url=url_item)
+
+        return None
 
     @staticmethod
     def detect_subtitles_type(subtitles_media: m3u8.Media) -> SubtitlesType | None:
@@ -424,7 +466,7 @@ class HLSScraper(Scraper, ABC):
         return None
 
     async def download_subtitles(self, media_data: m3u8.Media, subrip_conversion: bool = False) -> SubtitlesData:
-        playlist_m3u8 = self.load_playlist(url=media_data.absolute_uri)
+        playlist_m3u8 = await self.async_load_playlist(url=media_data.absolute_uri)
 
         if playlist_m3u8 is None:
             raise PlaylistLoadError("Could not load subtitles M3U8 playlist.")
@@ -435,7 +477,8 @@ class HLSScraper(Scraper, ABC):
         if len(downloaded_segments) > 1:
             for segment_data in downloaded_segments[1:]:
                 segment_subtitles_obj = self.subtitles_class(data=segment_data, language_code=media_data.language)
-                subtitles.append_subtitles(segment_subtitles_obj)
+                # Segment objects are discarded after merging, so their blocks don't need to be copied
+                subtitles.append_subtitles(segment_subtitles_obj, copy_blocks=False)
 
         subtitles.polish(
             fix_rtl=self.subtitles_fix_rtl,
@@ -495,24 +538,30 @@ class HLSScraper(Scraper, ABC):
         else:
             playlist_filters = filters
 
+        # Resolve attribute names and casefold filter values once, rather than for every media item
+        try:
+            attribute_filters: list[tuple[str, set[str]]] = [
+                (HLSScraper.M3U8Attribute(filter_name).name.lower(),
+                 {value.casefold() for value in single_to_list(filter_value)})
+                for filter_name, filter_value in (playlist_filters or {}).items()
+            ]
+
+        except ValueError:
+            # No media item can match an unknown attribute
+            return results
+
         for media in main_playlist.media:
-            if not playlist_filters:
+            if not attribute_filters:
                 results.append(media)
                 continue
 
             is_valid = True
 
-            for filter_name, filter_value in playlist_filters.items():
+            for attribute_name, filter_values in attribute_filters:
                 try:
-                    filter_name_enum = HLSScraper.M3U8Attribute(filter_name)
-                    attribute_value = getattr(media, filter_name_enum.name.lower(), None)
-
-                    if (attribute_value is None) or (
-                            isinstance(filter_value, list) and
-                            attribute_value.casefold() not in (x.casefold() for x in filter_value)
-                    ) or (
-                            isinstance(filter_value, str) and filter_value.casefold() != attribute_value.casefold()
-                    ):
+                    attribute_value = getattr(media, attribute_name, None)
+
+                    if attribute_value is None or attribute_value.casefold() not in filter_values:
                         is_valid = False
                         break
 
@@ -12,6 +12,7 @@ if TYPE_CHECKING:
     from isubrip.subtitle_formats.subrip import SubRipCaptionBlock, SubRipSubtitles
 
 RTL_CONTROL_CHARS = ('\u200e', '\u200f', '\u202a', '\u202b', '\u202c', '\u202d', '\u202e')
+RTL_CONTROL_CHARS_REMOVAL_TABLE = str.maketrans('', '', ''.join(RTL_CONTROL_CHARS))
 RTL_CHAR = '\u202b'
 RTL_LANGUAGES = ["ar", "he", "he-il"]
 
@@ -77,11 +78,10 @@ class SubtitlesCaptionBlock(SubtitlesBlock, ABC):
         previous_payload = self.payload
 
         # Remove previous RTL-related formatting
-        for char in RTL_CONTROL_CHARS:
-            self.payload = self.payload.replace(char, '')
+        payload = self.payload.translate(RTL_CONTROL_CHARS_REMOVAL_TABLE)
 
         # Add RLM char at the start of every line
-        self.payload = RTL_CHAR + self.payload.replace("\n", f"\n{RTL_CHAR}")
+        self.payload = RTL_CHAR + payload.replace("\n", f"\n{RTL_CHAR}")
 
         if self.payload != previous_payload:
             self.modified = True
@@ -263,18 +263,22 @@ class Subtitles(Generic[SubtitlesBlockT], ABC):
         return self
 
     def append_subtitles(self: SubtitlesT,
-                         subtitles: SubtitlesT) -> SubtitlesT:
+                         subtitles: SubtitlesT,
+                         copy_blocks: bool = True) -> SubtitlesT:
         """
         Append subtitles to an existing subtitles object.
 
         Args:
             subtitles (Subtitles): Subtitles object to append to current subtitles.
+            copy_blocks (bool, optional): Whether to append copies of the blocks, rather than the block objects
+                themselves. Should only be disabled if the appended subtitles object won't be used afterwards
+                (as it might be modified). Defaults to True.
 
         Returns:
             Subtitles: The current subtitles object.
         """
         if subtitles.blocks:
-            self.add_blocks(deepcopy(subtitles.blocks))
+            self.add_blocks(deepcopy(subtitles.blocks) if copy_blocks else subtitles.blocks.copy())
 
             if subtitles.modified():
                 self._modified = True
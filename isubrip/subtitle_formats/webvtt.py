@@ -203,7 +203,7 @@ class WebVTTSubtitles(Subtitles[WebVTTBlock]):
 
         for line in lines_iterator:
             # If the line is a timestamp
-            if caption_block_regex := re.match(WEBVTT_CAPTION_BLOCK_REGEX, line):
+            if caption_block_regex := WEBVTT_CAPTION_BLOCK_REGEX.match(line):
                 # If previous line wasn't empty, add it as an identifier
                 if prev_line:
                     caption_identifier = prev_line
@@ -230,7 +230,7 @@ class WebVTTSubtitles(Subtitles[WebVTTBlock]):
                     settings=caption_settings,
                     payload=caption_payload))
 
-            elif comment_block_regex := re.match(WEBVTT_COMMENT_HEADER_REGEX, line):
+            elif comment_block_regex := WEBVTT_COMMENT_HEADER_REGEX.match(line):
                 comment_payload = ""
                 inline = False
 
@@ -274,9 +274,10 @@ class WebVTTSubtitles(Subtitles[WebVTTBlock]):
             prev_line = line
 
     def append_subtitles(self: WebVTTSubtitles,
-                         subtitles: WebVTTSubtitles) -> WebVTTSubtitles:
+                         subtitles: WebVTTSubtitles,
+                         copy_blocks: bool = True) -> WebVTTSubtitles:
         if subtitles.blocks:
-            subtitles_copy = deepcopy(subtitles)
+            subtitles_copy = deepcopy(subtitles) if copy_blocks else subtitles
 
             # Remove head blocks from the subtitles that will be appended
             subtitles_copy.remove_head_blocks()
@@ -317,16 +318,17 @@ WEBVTT_CAPTION_SETTING_SIZE_REGEX = rf"size:{WEBVTT_PERCENTAGE_REGEX}"
 WEBVTT_CAPTION_SETTING_VERTICAL_REGEX = r"vertical:(?:lr|rl)"
 
 WEBVTT_CAPTION_SETTINGS_REGEX = ("(?:"
-                                 f"(?:{WEBVTT_CAPTION_SETTING_ALIGNMENT_REGEX})|"
-                                 f"(?:{WEBVTT_CAPTION_SETTING_LINE_REGEX})|"
-                                 f"(?:{WEBVTT_CAPTION_SETTING_POSITION_REGEX})|"
-                                 f"(?:{WEBVTT_CAPTION_SETTING_REGION_REGEX})|"
-                                 f"(?:{WEBVTT_CAPTION_SETTING_SIZE_REGEX})|"
-                                 f"(?:{WEBVTT_CAPTION_SETTING_VERTICAL_REGEX})|"
-                                 f"(?:[ \t]+)"
+                                 f"{WEBVTT_CAPTION_SETTING_ALIGNMENT_REGEX}|"
+                                 f"{WEBVTT_CAPTION_SETTING_LINE_REGEX}|"
+                                 f"{WEBVTT_CAPTION_SETTING_POSITION_REGEX}|"
+                                 f"{WEBVTT_CAPTION_SETTING_REGION_REGEX}|"
+                                 f"{WEBVTT_CAPTION_SETTING_SIZE_REGEX}|"
+                                 f"{WEBVTT_CAPTION_SETTING_VERTICAL_REGEX}|"
+                                 "[ \t]+"
                                  ")*")
 
-WEBVTT_CAPTION_BLOCK_REGEX = re.compile(rf"^({WEBVTT_CAPTION_TIMINGS_REGEX})[ \t]*({WEBVTT_CAPTION_SETTINGS_REGEX})?")
-WEBVTT_COMMENT_HEADER_REGEX = re.compile(rf"^{WebVTTCommentBlock.header}(?:$|[ \t])(.+)?")
+# NOTE: These patterns are used with 'match()', which is anchored to the start of the string.
+WEBVTT_CAPTION_BLOCK_REGEX = re.compile(rf"({WEBVTT_CAPTION_TIMINGS_REGEX})[ \t]*({WEBVTT_CAPTION_SETTINGS_REGEX})?")
+WEBVTT_COMMENT_HEADER_REGEX = re.compile(rf"{WebVTTCommentBlock.header}(?:$|[ \t])(.+)?")
 
 WEBVTT_ALIGN_TOP_TAG = "{\\an8}"
@@ -4,13 +4,18 @@ from abc import ABCMeta
 import datetime as dt
 from functools import lru_cache
 from pathlib import Path
-import re
 import secrets
 import shutil
 import sys
 from typing import TYPE_CHECKING, Any, Type, Union, get_args, get_origin
 
-from isubrip.constants import TEMP_FOLDER_PATH, TITLE_REPLACEMENT_STRINGS, WINDOWS_RESERVED_FILE_NAMES
+from isubrip import constants
+from isubrip.constants import (
+    MULTIPLE_DOTS_REGEX,
+    TITLE_REMOVAL_TABLE,
+    TITLE_REPLACEMENTS,
+    WINDOWS_RESERVED_FILE_NAMES,
+)
 from isubrip.data_structures import (
     Episode,
     MediaBase,
@@ -65,7 +70,7 @@ class TempDirGenerator:
             Path: Path to the generated directory.
         """
         directory_name = directory_name or secrets.token_hex(5)
-        full_path = TEMP_FOLDER_PATH / directory_name
+        full_path = constants.TEMP_FOLDER_PATH / directory_name
 
         if full_path.is_dir():
             if full_path in cls._generated_temp_directories:  # Generated by this class
@@ -548,6 +553,10 @@ def standardize_title(title: str) -> str:
     """
     Format movie title to a standardized title that can be used as a file name.
 
+    Examples:
+        standardize_title("Vol. - The End") -> "Vol.-The.End"
+        standardize_title("Title: Subtitle, Part 2 (2020)") -> "Title.Subtitle.Part.2.2020"
+
     Args:
         title (str): A movie title.
 
@@ -556,10 +565,12 @@ def standardize_title(title: str) -> str:
     """
     title = title.strip()
 
-    for string, replacement_string in TITLE_REPLACEMENT_STRINGS.items():
+    for string, replacement_string in TITLE_REPLACEMENTS:
         title = title.replace(string, replacement_string)
 
-    title = re.sub(r"\.+", ".", title)  # Replace multiple dots with a single dot
+    title = title.translate(TITLE_REMOVAL_TABLE)
+
+    title = MULTIPLE_DOTS_REGEX.sub(".", title)  # Replace multiple dots with a single dot
 
     # If running on Windows, rename Windows reserved names to allow file creation
     if sys.platform == 'win32':